@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 import logging
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
@@ -41,6 +42,22 @@ SERVICE_REFRESH_UPCOMING = "refresh_upcoming"
 SERVICE_REFRESH_EVENTS = "refresh_events"
 SERVICE_REFRESH_SCORES = "refresh_scores"
 SERVICE_REFRESH_ALL = "refresh_all"
+COORDINATOR_KEYS = (
+    DATA_COORD_SEASON,
+    DATA_COORD_RANKINGS,
+    DATA_COORD_UPCOMING,
+    DATA_COORD_EVENTS,
+    DATA_COORD_SCORES,
+)
+# Service name -> coordinator keys it refreshes across all entries.
+SERVICE_COORDINATOR_KEYS: dict[str, tuple[str, ...]] = {
+    SERVICE_REFRESH_SEASON: (DATA_COORD_SEASON,),
+    SERVICE_REFRESH_RANKINGS: (DATA_COORD_RANKINGS,),
+    SERVICE_REFRESH_UPCOMING: (DATA_COORD_UPCOMING,),
+    SERVICE_REFRESH_EVENTS: (DATA_COORD_EVENTS,),
+    SERVICE_REFRESH_SCORES: (DATA_COORD_SCORES,),
+    SERVICE_REFRESH_ALL: COORDINATOR_KEYS,
+}
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -65,14 +82,21 @@ async def _async_refresh_all_coordinators(
     scores_coord: MatchScoresCoordinator,
 ) -> None:
     """Kick off first refreshes without blocking config entry setup."""
+    # Season first: rankings and events derive their season id from it.
     try:
         await season_coord.async_refresh()
-        await rankings_coord.async_refresh()
-        await upcoming_coord.async_refresh()
-        await events_coord.async_refresh()
-        await scores_coord.async_refresh()
     except Exception:
-        _LOGGER.exception("Initial coordinator refresh task failed")
+        _LOGGER.exception("Initial coordinator refresh failed: coordinator=%s", season_coord.name)
+
+    coords = (rankings_coord, upcoming_coord, events_coord, scores_coord)
+    results = await asyncio.gather(*(coord.async_refresh() for coord in coords), return_exceptions=True)
+    for coord, result in zip(coords, results):
+        if isinstance(result, Exception):
+            _LOGGER.error(
+                "Initial coordinator refresh failed: coordinator=%s",
+                coord.name,
+                exc_info=result,
+            )
 
 
 def _schedule_initial_refresh_after_start(
@@ -171,7 +195,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         enable_calendar,
     )
 
-    api = SnookerOrgApi(hass, requested_by=requested_by)
+    api = SnookerOrgApi(hass, requested_by=requested_by, config_entry=entry)
+    await api.async_load_cache()
     player_cache = await load_player_cache(hass)
     _LOGGER.debug(
         "Loaded player cache for entry_id=%s with %s players (last_refreshed=%s)",
@@ -194,69 +219,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_SEASON):
-        async def _refresh_key(data_key: str) -> int:
-            refreshed = 0
-            for entry_data in hass.data.get(DOMAIN, {}).values():
-                coord = entry_data.get(data_key)
-                if coord is None:
+        async def _refresh_keys(data_keys: tuple[str, ...]) -> dict[str, int]:
+            targets = [
+                (data_key, coord)
+                for entry_data in hass.data.get(DOMAIN, {}).values()
+                for data_key in data_keys
+                if (coord := entry_data.get(data_key)) is not None
+            ]
+            results = await asyncio.gather(
+                *(coord.async_request_refresh() for _, coord in targets),
+                return_exceptions=True,
+            )
+            refreshed = dict.fromkeys(data_keys, 0)
+            for (data_key, coord), result in zip(targets, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Manual refresh failed: coordinator=%s", coord.name, exc_info=result)
                     continue
-                await coord.async_request_refresh()
-                refreshed += 1
+                refreshed[data_key] += 1
             return refreshed
 
-        async def _handle_refresh_season(call) -> None:
-            refreshed = await _refresh_key(DATA_COORD_SEASON)
-            if refreshed == 0:
-                _LOGGER.warning("Manual service refresh_season completed with no active coordinators")
-            _LOGGER.info("Manual service refresh_season completed: refreshed_entries=%s", refreshed)
-
-        async def _handle_refresh_rankings(call) -> None:
-            refreshed = await _refresh_key(DATA_COORD_RANKINGS)
-            if refreshed == 0:
-                _LOGGER.warning("Manual service refresh_rankings completed with no active coordinators")
-            _LOGGER.info("Manual service refresh_rankings completed: refreshed_entries=%s", refreshed)
-
-        async def _handle_refresh_upcoming(call) -> None:
-            refreshed = await _refresh_key(DATA_COORD_UPCOMING)
-            if refreshed == 0:
-                _LOGGER.warning("Manual service refresh_upcoming completed with no active coordinators")
-            _LOGGER.info("Manual service refresh_upcoming completed: refreshed_entries=%s", refreshed)
-
-        async def _handle_refresh_events(call) -> None:
-            refreshed = await _refresh_key(DATA_COORD_EVENTS)
-            if refreshed == 0:
-                _LOGGER.warning("Manual service refresh_events completed with no active coordinators")
-            _LOGGER.info("Manual service refresh_events completed: refreshed_entries=%s", refreshed)
-
-        async def _handle_refresh_scores(call) -> None:
-            refreshed = await _refresh_key(DATA_COORD_SCORES)
-            if refreshed == 0:
-                _LOGGER.warning("Manual service refresh_scores completed with no active coordinators")
-            _LOGGER.info("Manual service refresh_scores completed: refreshed_entries=%s", refreshed)
-
-        async def _handle_refresh_all(call) -> None:
-            refreshed_season = await _refresh_key(DATA_COORD_SEASON)
-            refreshed_rankings = await _refresh_key(DATA_COORD_RANKINGS)
-            refreshed_upcoming = await _refresh_key(DATA_COORD_UPCOMING)
-            refreshed_events = await _refresh_key(DATA_COORD_EVENTS)
-            refreshed_scores = await _refresh_key(DATA_COORD_SCORES)
-            if (refreshed_season + refreshed_rankings + refreshed_upcoming + refreshed_events + refreshed_scores) == 0:
-                _LOGGER.warning("Manual service refresh_all completed with no active coordinators")
-            _LOGGER.info(
-                "Manual service refresh_all completed: season=%s rankings=%s upcoming=%s events=%s scores=%s",
-                refreshed_season,
-                refreshed_rankings,
-                refreshed_upcoming,
-                refreshed_events,
-                refreshed_scores,
+        async def _handle_refresh(call, service_name: str, data_keys: tuple[str, ...]) -> None:
+            refreshed = await _refresh_keys(data_keys)
+            if sum(refreshed.values()) == 0:
+                _LOGGER.warning("Manual service %s completed with no active coordinators", service_name)
+            _LOGGER.info("Manual service %s completed: refreshed_entries=%s", service_name, refreshed)
+
+        for service_name, data_keys in SERVICE_COORDINATOR_KEYS.items():
+            hass.services.async_register(
+                DOMAIN,
+                service_name,
+                partial(_handle_refresh, service_name=service_name, data_keys=data_keys),
             )
-
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_SEASON, _handle_refresh_season)
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_RANKINGS, _handle_refresh_rankings)
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_UPCOMING, _handle_refresh_upcoming)
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_EVENTS, _handle_refresh_events)
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_SCORES, _handle_refresh_scores)
-        hass.services.async_register(DOMAIN, SERVICE_REFRESH_ALL, _handle_refresh_all)
         _LOGGER.debug("Registered services for domain=%s", DOMAIN)
 
     init_task = hass.async_create_task(
@@ -288,14 +281,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not data.get(DATA_PLATFORMS_LOADED):
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN]:
-            for service_name in (
-                SERVICE_REFRESH_SEASON,
-                SERVICE_REFRESH_RANKINGS,
-                SERVICE_REFRESH_UPCOMING,
-                SERVICE_REFRESH_EVENTS,
-                SERVICE_REFRESH_SCORES,
-                SERVICE_REFRESH_ALL,
-            ):
+            for service_name in SERVICE_COORDINATOR_KEYS:
                 if hass.services.has_service(DOMAIN, service_name):
                     hass.services.async_remove(DOMAIN, service_name)
             _LOGGER.debug("Removed services for domain=%s", DOMAIN)
@@ -308,14 +294,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN]:
-            for service_name in (
-                SERVICE_REFRESH_SEASON,
-                SERVICE_REFRESH_RANKINGS,
-                SERVICE_REFRESH_UPCOMING,
-                SERVICE_REFRESH_EVENTS,
-                SERVICE_REFRESH_SCORES,
-                SERVICE_REFRESH_ALL,
-            ):
+            for service_name in SERVICE_COORDINATOR_KEYS:
                 if hass.services.has_service(DOMAIN, service_name):
                     hass.services.async_remove(DOMAIN, service_name)
             _LOGGER.debug("Removed services for domain=%s", DOMAIN)
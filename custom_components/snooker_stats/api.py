@@ -1,42 +1,144 @@
 from __future__ import annotations
 
 import asyncio
+from email.utils import parsedate_to_datetime
 import logging
-from time import perf_counter
+import random
+from time import perf_counter, time
 from typing import Any
 
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-from .const import BASE_URL, HEADER_NAME
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant core ships orjson
+    orjson = None
+
+from .const import BASE_URL, DOMAIN, HEADER_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
+# Base query params per endpoint; never mutated, copied only when a tour is added.
+_P_CURRENT_SEASON: dict[str, Any] = {"t": 20}
+_P_UPCOMING_MATCHES: dict[str, Any] = {"t": 14}
+_P_CURRENT_MATCHES: dict[str, Any] = {"t": 17}
+
+API_CACHE_STORE_VERSION = 1
+API_CACHE_STORE_KEY = f"{DOMAIN}_api_cache"
+API_CACHE_SAVE_DELAY_S = 30
+
+# Response TTLs for effectively immutable endpoints; anything not listed is never cached.
+# Season/events responses are always written through but only read back when a caller opts in
+# (startup and fallback lookups), so scheduled and manual coordinator refreshes hit the API.
+_CACHE_TTL_S: dict[str, float] = {
+    "get_player": 30 * 86400,
+    "get_events_in_season": 12 * 3600,
+    "get_current_season": 12 * 3600,
+}
+
+# 403 handling: exponential backoff with jitter, honoring Retry-After, then give up.
+RATE_LIMIT_MAX_ATTEMPTS = 6
+RATE_LIMIT_MAX_DELAY_S = 60
+RATE_LIMIT_MAX_RETRY_AFTER_S = 300
+
+# Max player lookups in flight at once, shared by every caller of one client.
+PLAYER_FETCH_CONCURRENCY = 4
+
+# JSON decoders only produce exact list/dict instances, so `type(...) is` checks are safe here.
+
 def _first_dict(payload: Any) -> dict[str, Any]:
     """snooker.org sometimes returns a list with one dict; normalize that."""
-    if isinstance(payload, list):
-        if payload and isinstance(payload[0], dict):
+    payload_type = type(payload)
+    if payload_type is list:
+        if payload and type(payload[0]) is dict:
             return payload[0]
         return {}
-    if isinstance(payload, dict):
+    if payload_type is dict:
         return payload
     return {}
 
 def _as_list(payload: Any) -> list[dict[str, Any]]:
-    """Normalize payload to list[dict]."""
-    if isinstance(payload, list):
-        return [x for x in payload if isinstance(x, dict)]
-    if isinstance(payload, dict):
+    """Normalize payload to list[dict], returning clean lists without copying."""
+    payload_type = type(payload)
+    if payload_type is list:
+        if all(type(x) is dict for x in payload):
+            return payload
+        return [x for x in payload if type(x) is dict]
+    if payload_type is dict:
         return [payload]
     return []
 
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimitedError(Exception):
+    """Raised when snooker.org keeps answering 403 after all retry attempts."""
+
 class SnookerOrgApi:
-    def __init__(self, hass, requested_by: str) -> None:
+    __slots__ = (
+        "hass",
+        "config_entry",
+        "requested_by",
+        "_concurrency",
+        "_sem",
+        "_headers",
+        "_cache",
+        "_store",
+        "_inflight",
+    )
+
+    def __init__(
+        self,
+        hass,
+        requested_by: str,
+        concurrency: int = PLAYER_FETCH_CONCURRENCY,
+        config_entry=None,
+    ) -> None:
         self.hass = hass
+        self.config_entry = config_entry
         self.requested_by = requested_by
+        self._concurrency = max(1, concurrency)
+        self._sem = asyncio.Semaphore(self._concurrency)
+        self._headers = {HEADER_NAME: requested_by}
+        # cache key -> (fetched_at epoch seconds, payload)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._store: Store = Store(hass, API_CACHE_STORE_VERSION, API_CACHE_STORE_KEY)
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict[str, Any]) -> str:
+        return endpoint + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
 
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {HEADER_NAME: self.requested_by}
+    async def async_load_cache(self) -> None:
+        """Restore unexpired cached responses persisted by a previous run."""
+        data = await self._store.async_load() or {}
+        now = time()
+        for key, (fetched_at, payload) in data.get("entries", {}).items():
+            ttl = _CACHE_TTL_S.get(key.partition("?")[0], 0)
+            if now - fetched_at < ttl:
+                self._cache[key] = (fetched_at, payload)
+        _LOGGER.debug("Loaded API response cache from storage: entries=%s", len(self._cache))
+
+    def _cache_data(self) -> dict[str, Any]:
+        now = time()
+        return {
+            "entries": {
+                key: [fetched_at, payload]
+                for key, (fetched_at, payload) in self._cache.items()
+                if now - fetched_at < _CACHE_TTL_S.get(key.partition("?")[0], 0)
+            }
+        }
 
     @staticmethod
     def _payload_summary(payload: Any) -> str:
@@ -47,37 +149,98 @@ class SnookerOrgApi:
             return f"dict(keys={list(payload.keys())})"
         return f"{type(payload).__name__}"
 
-    async def _get_json(self, params: dict[str, Any], endpoint: str, retry_context: str | None = None) -> Any:
+    @staticmethod
+    async def _decode_json(resp) -> Any:
+        """Decode with orjson when available; blank bodies decode to None like resp.json()."""
+        if orjson is None:
+            return await resp.json(content_type=None)
+        body = await resp.read()
+        if not body.strip():
+            return None
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Let aiohttp's stdlib decoder have the final say (and raise its usual error)
+            return await resp.json(content_type=None)
+
+    async def _get_json(
+        self,
+        params: dict[str, Any],
+        endpoint: str,
+        retry_context: str | None = None,
+        use_cache: bool = True,
+    ) -> Any:
+        ttl = _CACHE_TTL_S.get(endpoint, 0)
+        key = self._cache_key(endpoint, params)
+        if ttl and use_cache:
+            cached = self._cache.get(key)
+            if cached is not None and time() - cached[0] < ttl:
+                _LOGGER.debug("API cache hit: endpoint=%s params=%s", endpoint, params)
+                return cached[1]
+
+        # Identical concurrent requests share one fetch; shield it so a cancelled caller doesn't cancel the rest.
+        # The fetch runs as an HA-owned background task so entry unload / shutdown cancels it.
+        task = self._inflight.get(key)
+        if task is None:
+            target = self._fetch_and_cache(params, endpoint, retry_context, key, ttl)
+            name = f"{DOMAIN} {endpoint}"
+            if self.config_entry is not None:
+                task = self.config_entry.async_create_background_task(self.hass, target, name)
+            else:
+                task = self.hass.async_create_background_task(target, name)
+            if not task.done():
+                self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_fetch_done(key, done))
+        else:
+            _LOGGER.debug("API request coalesced: endpoint=%s params=%s", endpoint, params)
+        return await asyncio.shield(task)
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome as retrieved even if every waiter was cancelled; _fetch_json already logged it.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_and_cache(
+        self,
+        params: dict[str, Any],
+        endpoint: str,
+        retry_context: str | None,
+        key: str,
+        ttl: float,
+    ) -> Any:
+        payload = await self._fetch_json(params, endpoint, retry_context)
+        if ttl:
+            self._cache[key] = (time(), payload)
+            self._store.async_delay_save(self._cache_data, API_CACHE_SAVE_DELAY_S)
+        return payload
+
+    async def _fetch_json(self, params: dict[str, Any], endpoint: str, retry_context: str | None = None) -> Any:
         session = async_get_clientsession(self.hass)
         attempt = 0
         while True:
             attempt += 1
             start = perf_counter()
             _LOGGER.debug("API request start: endpoint=%s params=%s attempt=%s", endpoint, params, attempt)
+            retry_after: str | None = None
             try:
                 async with session.get(BASE_URL, params=params, headers=self._headers, timeout=30) as resp:
                     if resp.status == 403:
-                        _LOGGER.warning(
-                            "API rate limited (403): endpoint=%s params=%s attempt=%s context=%s; retrying in 60 seconds",
-                            endpoint,
-                            params,
-                            attempt,
-                            retry_context or "-",
-                        )
-                        await asyncio.sleep(60)
-                        continue
-
-                    resp.raise_for_status()
-                    payload = await resp.json(content_type=None)
-                    _LOGGER.debug(
-                        "API request success: endpoint=%s status=%s duration_ms=%.1f attempt=%s payload=%s",
-                        endpoint,
-                        resp.status,
-                        (perf_counter() - start) * 1000,
-                        attempt,
-                        self._payload_summary(payload),
-                    )
-                    return payload
+                        retry_after = resp.headers.get("Retry-After")
+                    else:
+                        resp.raise_for_status()
+                        payload = await self._decode_json(resp)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug(
+                                "API request success: endpoint=%s status=%s duration_ms=%.1f attempt=%s payload=%s",
+                                endpoint,
+                                resp.status,
+                                (perf_counter() - start) * 1000,
+                                attempt,
+                                self._payload_summary(payload),
+                            )
+                        return payload
             except Exception:
                 _LOGGER.exception(
                     "API request failed: endpoint=%s params=%s duration_ms=%.1f attempt=%s",
@@ -88,9 +251,34 @@ class SnookerOrgApi:
                 )
                 raise
 
+            # 403: back off outside the response context so the connection is released while waiting.
+            if attempt >= RATE_LIMIT_MAX_ATTEMPTS:
+                _LOGGER.warning(
+                    "API rate limited (403): endpoint=%s params=%s attempt=%s context=%s; giving up",
+                    endpoint,
+                    params,
+                    attempt,
+                    retry_context or "-",
+                )
+                raise RateLimitedError(f"snooker.org rate limited {endpoint} after {attempt} attempts")
+            delay = _retry_after_seconds(retry_after)
+            if delay is None:
+                delay = min(RATE_LIMIT_MAX_DELAY_S, 2**attempt) + random.uniform(0, 1)
+            else:
+                delay = min(delay, RATE_LIMIT_MAX_RETRY_AFTER_S)
+            _LOGGER.warning(
+                "API rate limited (403): endpoint=%s params=%s attempt=%s context=%s; retrying in %.1f seconds",
+                endpoint,
+                params,
+                attempt,
+                retry_context or "-",
+                delay,
+            )
+            await asyncio.sleep(delay)
+
     # Current season (t=20)
-    async def get_current_season(self) -> dict[str, Any]:
-        payload = await self._get_json({"t": 20}, endpoint="get_current_season")
+    async def get_current_season(self, use_cache: bool = False) -> dict[str, Any]:
+        payload = await self._get_json(_P_CURRENT_SEASON, endpoint="get_current_season", use_cache=use_cache)
         return _first_dict(payload)
 
     # Rankings (?rt=...&s=YYYY)
@@ -103,23 +291,19 @@ class SnookerOrgApi:
 
     # Upcoming matches (t=14, optional tr)
     async def get_upcoming_matches(self, tour: str | None = None) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {"t": 14}
-        if tour:
-            params["tr"] = tour
+        params = {**_P_UPCOMING_MATCHES, "tr": tour} if tour else _P_UPCOMING_MATCHES
         return await self._get_json(params, endpoint="get_upcoming_matches")
 
     # Events in season (t=5, with season and optional tour)
-    async def get_events_in_season(self, season: int, tour: str | None = None) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {"t": 5, "s": season}
-        if tour:
-            params["tr"] = tour
-        return await self._get_json(params, endpoint="get_events_in_season")
+    async def get_events_in_season(
+        self, season: int, tour: str | None = None, use_cache: bool = False
+    ) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {"t": 5, "s": season, "tr": tour} if tour else {"t": 5, "s": season}
+        return await self._get_json(params, endpoint="get_events_in_season", use_cache=use_cache)
 
     # Current/near-live matches: t=17 (&tr=...)
     async def get_current_matches(self, tour: str | None = None) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {"t": 17}
-        if tour:
-            params["tr"] = tour
+        params = {**_P_CURRENT_MATCHES, "tr": tour} if tour else _P_CURRENT_MATCHES
         payload = await self._get_json(params, endpoint="get_current_matches")
         return _as_list(payload)
 
@@ -137,18 +321,43 @@ class SnookerOrgApi:
         return _first_dict(payload)
 
     async def paced_player_fetch(self, player_ids: list[int], delay_s: float = 5.0) -> dict[int, dict[str, Any]]:
-        """Fetch players with a fixed delay between calls (rate-limit friendly)."""
+        """Fetch players with bounded concurrency, each slot pausing delay_s after its request (rate-limit friendly).
+
+        Failed players are logged and left out; raises the first error (preferring RateLimitedError)
+        when none could be fetched.
+        """
         out: dict[int, dict[str, Any]] = {}
         total = len(player_ids)
-        _LOGGER.debug("Paced player fetch started: player_count=%s delay_s=%s", total, delay_s)
-        for idx, pid in enumerate(player_ids, start=1):
-            out[pid] = await self.get_player(pid, progress=f"{idx}/{total}")
-            _LOGGER.debug(
-                "Paced player fetch progress: fetched_player_id=%s fetched_total=%s total=%s",
-                pid,
-                len(out),
-                total,
-            )
-            await asyncio.sleep(delay_s)
-        _LOGGER.debug("Paced player fetch completed: fetched=%s", len(out))
+        _LOGGER.debug(
+            "Paced player fetch started: player_count=%s delay_s=%s concurrency=%s",
+            total,
+            delay_s,
+            self._concurrency,
+        )
+
+        async def _one(idx: int, pid: int) -> tuple[int, dict[str, Any]]:
+            async with self._sem:
+                payload = await self.get_player(pid, progress=f"{idx}/{total}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Paced player fetch progress: fetched_player_id=%s total=%s", pid, total)
+                # Hold the slot for delay_s, so the aggregate rate stays at or below concurrency / delay_s.
+                await asyncio.sleep(delay_s)
+                return pid, payload
+
+        results = await asyncio.gather(
+            *(_one(idx, pid) for idx, pid in enumerate(player_ids, start=1)),
+            return_exceptions=True,
+        )
+        first_error: BaseException | None = None
+        for pid, result in zip(player_ids, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Paced player fetch failed: player_id=%s error=%s", pid, result)
+                if first_error is None or isinstance(result, RateLimitedError):
+                    first_error = result
+                continue
+            out[result[0]] = result[1]
+        if first_error is not None and not out:
+            # Nothing usable came back; surface the failure instead of an empty success.
+            raise first_error
+        _LOGGER.debug("Paced player fetch completed: fetched=%s failed=%s", len(out), total - len(out))
         return out
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -9,6 +12,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from .const import DATA_COORD_EVENTS, DATA_COORD_UPCOMING, DOMAIN, TOUR_LABELS
+from .coordinator import UNKNOWN_EVENT_DETAILS
+
+_START = itemgetter("Start")
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
@@ -20,6 +26,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
 
 class SnookerUpcomingCalendar(CalendarEntity):
+    # CalendarEntity keeps a __dict__, so these slots only move our own hot attributes to descriptors.
+    __slots__ = (
+        "coordinator",
+        "events_coordinator",
+        "tour_code",
+        "_unsub_coordinator",
+        "_unsub_events_coordinator",
+        "_last_state",
+    )
+
     def __init__(self, coord, events_coord, tour_code: str):
         self.coordinator = coord
         self.events_coordinator = events_coord
@@ -28,11 +44,27 @@ class SnookerUpcomingCalendar(CalendarEntity):
         self._attr_unique_id = f"snooker_org_calendar_upcoming_{tour_code}"
         self._unsub_coordinator = None
         self._unsub_events_coordinator = None
+        self._last_state: tuple[list[dict[str, Any]] | None, list[tuple[str, str]]] | None = None
 
     async def async_added_to_hass(self):
-        self._unsub_coordinator = self.coordinator.async_add_listener(self.async_write_ha_state)
+        self._unsub_coordinator = self.coordinator.async_add_listener(self._handle_coordinator_update)
         self._unsub_events_coordinator = self.events_coordinator.async_add_listener(self.async_write_ha_state)
 
+    def _handle_coordinator_update(self) -> None:
+        # Refreshes rebuild every per-tour list, so compare contents: skip the write when this tour's
+        # (small) match list is unchanged, e.g. after a failed refresh or one that only touched other tours.
+        # Names are resolved at read time, so they are part of the key: enrichment alone must still publish.
+        matches = (self.coordinator.data or {}).get("matches_by_tour", {}).get(self.tour_code)
+        names = [
+            (self._resolve_player_name(m.get("Player1ID")), self._resolve_player_name(m.get("Player2ID")))
+            for m in matches or ()
+        ]
+        state = (matches, names)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.async_write_ha_state()
+
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub_coordinator:
             self._unsub_coordinator()
@@ -44,38 +76,28 @@ class SnookerUpcomingCalendar(CalendarEntity):
     @property
     def event(self) -> CalendarEvent | None:
         now = dt_util.utcnow()
-        upcoming = self._collect_events(start_date=now, end_date=now + timedelta(days=365))
-        return upcoming[0] if upcoming else None
+        return next(self._iter_events(start_date=now, end_date=now + timedelta(days=365)), None)
 
     async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime):
         return self._collect_events(start_date=start_date, end_date=end_date)
 
     def _collect_events(self, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+        return list(self._iter_events(start_date=start_date, end_date=end_date))
+
+    def _iter_events(self, start_date: datetime, end_date: datetime) -> Iterator[CalendarEvent]:
+        """Yield events in the window in start order, building each one only when consumed."""
         start_utc = dt_util.as_utc(start_date) if start_date.tzinfo else dt_util.as_utc(dt_util.as_local(start_date))
         end_utc = dt_util.as_utc(end_date) if end_date.tzinfo else dt_util.as_utc(dt_util.as_local(end_date))
 
         data = self.coordinator.data or {}
-        matches: list[dict[str, Any]] = data.get("matches", [])
-        events: list[CalendarEvent] = []
-
-        for m in matches:
-            if m.get("Tour") != self.tour_code:
-                continue
-
-            raw = m.get("ScheduledDate")
-            if not raw:
-                continue
-
-            # Many snooker.org payloads use "YYYY-MM-DD HH:MM:SS" style strings; parse loosely
-            dt = dt_util.parse_datetime(str(raw).replace(" ", "T"))
-            if not dt:
-                continue
-
-            dt = dt_util.as_utc(dt) if dt.tzinfo else dt_util.as_utc(dt_util.as_local(dt))
-
-            if dt < start_utc or dt > end_utc:
-                continue
-
+        # Pre-filtered per tour and sorted by parsed UTC start in the coordinator
+        matches: list[dict[str, Any]] = data.get("matches_by_tour", {}).get(self.tour_code, [])
+        lo = bisect_left(matches, start_utc, key=_START)
+        hi = bisect_right(matches, end_utc, lo=lo, key=_START)
+
+        for idx in range(lo, hi):
+            m = matches[idx]
+            dt = m["Start"]
             p1 = self._resolve_player_name(m.get("Player1ID"))
             p2 = self._resolve_player_name(m.get("Player2ID"))
             event_name = f"{p1} vs {p2}"
@@ -83,34 +105,25 @@ class SnookerUpcomingCalendar(CalendarEntity):
             # Assume 2-hour default duration if not provided
             end_dt = dt + timedelta(hours=2)
 
-            events.append(
-                CalendarEvent(
-                    summary=event_name,
-                    start=dt,
-                    end=end_dt,
-                    description=self._event_details(m.get("EventID")),
-                    location="",
-                )
+            yield CalendarEvent(
+                summary=event_name,
+                start=dt,
+                end=end_dt,
+                description=self._event_details(m.get("EventID")),
+                location="",
             )
-        events.sort(key=lambda e: e.start)
-        return events
 
     def _resolve_player_name(self, player_id: Any) -> str:
         try:
             pid = int(player_id)
         except Exception:
             return "TBD"
-        return self.coordinator.player_cache.players.get(pid, f"#{pid}")
+        return self.coordinator.player_cache.players.get(pid) or f"#{pid}"
 
     def _event_details(self, event_id: Any) -> str:
         try:
             eid = int(event_id)
         except Exception:
-            return "Unknown - Unknown - Unknown - Unknown"
-        event_map = (self.events_coordinator.data or {}).get("events_by_id", {})
-        info = event_map.get(eid, {})
-        name = str(info.get("Name") or "Unknown")
-        event_type = str(info.get("Type") or "Unknown")
-        city = str(info.get("City") or "Unknown")
-        venue = str(info.get("Venue") or "Unknown")
-        return f"{name} - {event_type} - {city} - {venue}"
+            return UNKNOWN_EVENT_DETAILS
+        details_by_id = (self.events_coordinator.data or {}).get("event_details_by_id", {})
+        return details_by_id.get(eid, UNKNOWN_EVENT_DETAILS)
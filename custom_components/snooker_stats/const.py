@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 DOMAIN = "snooker_stats"
 
 CONF_REQUESTED_BY = "requested_by"
@@ -22,16 +24,19 @@ BASE_URL = "https://api.snooker.org/"
 HEADER_NAME = "X-Requested-By"  # required by snooker.org API docs
 
 # These are the human-facing UI labels and their API codes
-TOUR_CHOICES = {
-    "Main tour": "main",
-    "Q Tour": "q",
-    "Seniors": "seniors",
-    "Women": "women",
-    "EBSA": "ebsa",
-    "WSF": "wsf",
-    "Other": "other",
-}
-TOUR_LABELS = {code: label for label, code in TOUR_CHOICES.items()}
+TOUR_CHOICES = MappingProxyType(
+    {
+        "Main tour": "main",
+        "Q Tour": "q",
+        "Seniors": "seniors",
+        "Women": "women",
+        "EBSA": "ebsa",
+        "WSF": "wsf",
+        "Other": "other",
+    }
+)
+# Reverse of TOUR_CHOICES (API code -> UI label)
+TOUR_LABELS = MappingProxyType({code: label for label, code in TOUR_CHOICES.items()})
 
 # Ranking types (from API docs)
 RANKING_MONEY = "MoneyRankings"
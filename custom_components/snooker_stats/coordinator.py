@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import timedelta
+from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 import logging
+import sys
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
@@ -23,6 +26,24 @@ PLAYER_CACHE_STORE_VERSION = 1
 PLAYER_CACHE_STORE_KEY = f"{DOMAIN}_player_cache"
 
 MONTHLY_REFRESH_DAYS = 30
+# Saves within this window are coalesced into a single write
+PLAYER_CACHE_SAVE_DELAY_S = 10
+
+# Per-slot pacing handed to SnookerOrgApi.paced_player_fetch: each of the client's concurrent slots
+# waits this long after its request, capping lookups at PLAYER_FETCH_CONCURRENCY / delay per second.
+ENRICH_PLAYER_DELAY_S = 1.0
+MONTHLY_PLAYER_DELAY_S = 5.0
+
+UNKNOWN_EVENT_DETAILS = sys.intern("Unknown - Unknown - Unknown - Unknown")
+
+
+def _format_event_details(event: dict[str, Any]) -> str:
+    """Render the calendar description line for a normalized event."""
+    details = (
+        f"{event['Name'] or 'Unknown'} - {event['Type'] or 'Unknown'} - "
+        f"{event['City'] or 'Unknown'} - {event['Venue'] or 'Unknown'}"
+    )
+    return UNKNOWN_EVENT_DETAILS if details == UNKNOWN_EVENT_DETAILS else details
 
 
 @dataclass
@@ -30,6 +51,24 @@ class PlayerCache:
     # maps player_id -> display_name
     players: dict[int, str]
     last_refreshed: str | None  # ISO string
+    store: Store | None = field(default=None, repr=False, compare=False)
+    # str-keyed mirror of players in storage form; keep in sync via set_player()
+    players_str: dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+    # parsed last_refreshed, so the monthly check does not re-parse the ISO string
+    last_refreshed_dt: datetime | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.players_str) != len(self.players):
+            self.players_str = {str(k): v for k, v in self.players.items()}
+        if self.last_refreshed and self.last_refreshed_dt is None:
+            try:
+                self.last_refreshed_dt = dt_util.parse_datetime(self.last_refreshed)
+            except Exception:
+                self.last_refreshed_dt = None
+
+    def set_player(self, player_id: int, name: str) -> None:
+        self.players[player_id] = name
+        self.players_str[str(player_id)] = name
 
 
 async def load_player_cache(hass: HomeAssistant) -> PlayerCache:
@@ -37,35 +76,104 @@ async def load_player_cache(hass: HomeAssistant) -> PlayerCache:
     data = await store.async_load() or {}
     players_raw = data.get("players", {})
     players = {int(k): str(v) for k, v in players_raw.items()}
+    players_str = {str(k): v for k, v in players.items()}
     _LOGGER.debug(
         "Loaded player cache from storage: players=%s last_refreshed=%s",
         len(players),
         data.get("last_refreshed"),
     )
-    return PlayerCache(players=players, last_refreshed=data.get("last_refreshed"))
+    return PlayerCache(
+        players=players,
+        last_refreshed=data.get("last_refreshed"),
+        store=store,
+        players_str=players_str,
+    )
 
 
-async def save_player_cache(hass: HomeAssistant, cache: PlayerCache) -> None:
-    store = Store(hass, PLAYER_CACHE_STORE_VERSION, PLAYER_CACHE_STORE_KEY)
-    await store.async_save(
-        {"players": {str(k): v for k, v in cache.players.items()}, "last_refreshed": cache.last_refreshed}
-    )
+def _player_cache_data(cache: PlayerCache) -> dict[str, Any]:
+    return {"players": cache.players_str, "last_refreshed": cache.last_refreshed}
+
+
+def save_player_cache(hass: HomeAssistant, cache: PlayerCache) -> None:
+    """Schedule a debounced write; the snapshot is taken when the Store flushes."""
+    if cache.store is None:
+        cache.store = Store(hass, PLAYER_CACHE_STORE_VERSION, PLAYER_CACHE_STORE_KEY)
+    cache.store.async_delay_save(lambda: _player_cache_data(cache), PLAYER_CACHE_SAVE_DELAY_S)
     _LOGGER.debug(
-        "Saved player cache to storage: players=%s last_refreshed=%s",
+        "Scheduled player cache save: players=%s last_refreshed=%s delay_s=%s",
         len(cache.players),
         cache.last_refreshed,
+        PLAYER_CACHE_SAVE_DELAY_S,
     )
 
 
+def _parse_scheduled(raw: Any) -> datetime | None:
+    """Parse a snooker.org "YYYY-MM-DD HH:MM:SS" timestamp."""
+    # dt_util.parse_datetime tries the C ciso8601 parser before its regex fallback
+    return dt_util.parse_datetime(str(raw).replace(" ", "T"))
+
+
+def _index_matches_by_tour(matches: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Group matches per tour with a parsed UTC "Start", each list sorted by start."""
+    by_tour: dict[str, list[dict[str, Any]]] = {}
+    for m in matches:
+        dt = _parse_scheduled(m["ScheduledDate"])
+        if not dt:
+            continue
+        dt = dt_util.as_utc(dt) if dt.tzinfo else dt_util.as_utc(dt_util.as_local(dt))
+        by_tour.setdefault(m["Tour"], []).append(
+            {
+                "Start": dt,
+                "EventID": m["EventID"],
+                "Player1ID": m["Player1ID"],
+                "Player2ID": m["Player2ID"],
+            }
+        )
+    for tour_matches in by_tour.values():
+        tour_matches.sort(key=itemgetter("Start"))
+    return by_tour
+
+
+async def _async_fetch_per_tour(
+    coordinator_name: str,
+    tours: list[str],
+    fetch: Callable[[str], Awaitable[list[dict[str, Any]]]],
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Fetch every tour concurrently; any failed tour fails the whole update.
+
+    Raising lets DataUpdateCoordinator keep the last good snapshot instead of publishing one
+    with the failed tours silently missing.
+    """
+    results = await asyncio.gather(*(fetch(tr) for tr in tours), return_exceptions=True)
+    fetched: list[tuple[str, list[dict[str, Any]]]] = []
+    errors: list[BaseException] = []
+    for tr, result in zip(tours, results):
+        if isinstance(result, asyncio.CancelledError):
+            # e.g. the shared fetch was cancelled on entry unload; do not report it as a failed update
+            raise result
+        if isinstance(result, BaseException):
+            _LOGGER.warning("%s API request failed for tour=%s: %s", coordinator_name, tr, result)
+            errors.append(result)
+            continue
+        _LOGGER.debug("%s API response for tour=%s: count=%s", coordinator_name, tr, len(result))
+        fetched.append((tr, result))
+    if errors:
+        raise errors[0]
+    return fetched
+
+
 def _player_name_from_payload(p: dict[str, Any]) -> str:
     # The player payload fields vary; this tries common patterns safely.
-    for key in ("Name", "FullName", "DisplayName"):
-        if key in p and p[key]:
-            return str(p[key])
+    if (v := p.get("Name")) or (v := p.get("FullName")) or (v := p.get("DisplayName")):
+        return v if type(v) is str else str(v)
     # fallback to concatenation if FirstName/LastName exist
-    fn = str(p.get("FirstName", "")).strip()
-    ln = str(p.get("LastName", "")).strip()
-    name = (fn + " " + ln).strip()
+    fn = p.get("FirstName") or ""
+    ln = p.get("LastName") or ""
+    if type(fn) is not str:
+        fn = str(fn)
+    if type(ln) is not str:
+        ln = str(ln)
+    name = f"{fn.strip()} {ln.strip()}".strip()
     return name or f"Player {p.get('ID', '?')}"
 
 
@@ -96,13 +204,15 @@ class SeasonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         try:
             _LOGGER.debug("SeasonCoordinator refresh started")
-            payload = await self.api.get_current_season()
-            _LOGGER.debug(
-                "SeasonCoordinator response: keys=%s season=%s id=%s",
-                list(payload.keys()),
-                payload.get("Season"),
-                payload.get("ID"),
-            )
+            # Only the first refresh after setup may reuse a persisted response; later ones are explicit refreshes.
+            payload = await self.api.get_current_season(use_cache=self.data is None)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "SeasonCoordinator response: keys=%s season=%s id=%s",
+                    list(payload.keys()),
+                    payload.get("Season"),
+                    payload.get("ID"),
+                )
             return payload
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch current season: {err}") from err
@@ -123,9 +233,10 @@ class RankingsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         try:
             _LOGGER.debug("RankingsCoordinator refresh started")
-            season_payload = self.season_coord.data or await self.api.get_current_season()
+            season_payload = self.season_coord.data or await self.api.get_current_season(use_cache=True)
             season = _extract_season(season_payload)
-            _LOGGER.debug("RankingsCoordinator using season=%s season_payload_keys=%s", season, list(season_payload.keys()))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("RankingsCoordinator using season=%s season_payload_keys=%s", season, list(season_payload.keys()))
             money = await self.api.get_rankings(season, RANKING_MONEY)
             one_year = await self.api.get_rankings(season, RANKING_ONE_YEAR_MONEY)
             _LOGGER.debug(
@@ -135,12 +246,14 @@ class RankingsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             # Top 10, with names resolved via cache if possible
+            # Rows are fresh per request and not reused, so they are decorated in place
+            players = self.player_cache.players
+
             def decorate(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-                out = []
-                for r in rows[:10]:
-                    pid = int(r.get("PlayerID", r.get("ID", 0)) or 0)
-                    name = self.player_cache.players.get(pid)
-                    out.append({**r, "PlayerName": name or f"#{pid}"})
+                out = rows[:10]
+                for r in out:
+                    pid = int(r.get("PlayerID") or r.get("ID") or 0)
+                    r["PlayerName"] = players.get(pid) or f"#{pid}"
                 return out
 
             result = {
@@ -148,12 +261,13 @@ class RankingsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "top10_money": decorate(money),
                 "top10_one_year_money": decorate(one_year),
             }
-            _LOGGER.debug(
-                "RankingsCoordinator decorated result: top10_money=%s top10_one_year=%s first_money_keys=%s",
-                len(result["top10_money"]),
-                len(result["top10_one_year_money"]),
-                list((result["top10_money"][0] if result["top10_money"] else {}).keys()),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "RankingsCoordinator decorated result: top10_money=%s top10_one_year=%s first_money_keys=%s",
+                    len(result["top10_money"]),
+                    len(result["top10_one_year_money"]),
+                    list((result["top10_money"][0] if result["top10_money"] else {}).keys()),
+                )
             return result
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch rankings: {err}") from err
@@ -175,11 +289,7 @@ class UpcomingMatchesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             # pull upcoming for each tour and merge
             _LOGGER.debug("UpcomingMatchesCoordinator refresh started: tours=%s", self.tours)
-            all_matches: list[dict[str, Any]] = []
-            for tr in self.tours:
-                tour_matches = await self.api.get_upcoming_matches(tr)
-                _LOGGER.debug("UpcomingMatchesCoordinator API response for tour=%s: count=%s", tr, len(tour_matches))
-                all_matches.extend([{**match, "Tour": tr} for match in tour_matches])
+            fetched = await _async_fetch_per_tour("UpcomingMatchesCoordinator", self.tours, self.api.get_upcoming_matches)
 
             def as_int(pid: Any) -> int | None:
                 try:
@@ -187,32 +297,34 @@ class UpcomingMatchesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 except Exception:
                     return None
 
+            # Single pass: normalize each match, tagging its tour from the request rather than
+            # copying or mutating the upstream payload, and collect players missing from the cache
+            players = self.player_cache.players
             decorated: list[dict[str, Any]] = []
-            for m in all_matches:
-                p1 = m.get("Player1ID") or m.get("P1") or m.get("Player1")
-                p2 = m.get("Player2ID") or m.get("P2") or m.get("Player2")
-                scheduled = m.get("ScheduledDate") or m.get("StartDate") or m.get("Date")
-                if not scheduled:
-                    continue
-
-                decorated.append(
-                    {
-                        "Tour": str(m.get("Tour") or ""),
-                        "EventID": as_int(m.get("EventID") or m.get("Event") or m.get("EID")),
-                        "ScheduledDate": str(scheduled),
-                        "Player1ID": as_int(p1),
-                        "Player2ID": as_int(p2),
-                    }
-                )
-
             missing_player_ids: set[int] = set()
-            for match in decorated:
-                for key in ("Player1ID", "Player2ID"):
-                    pid = match.get(key)
-                    if pid is None:
+            append_decorated = decorated.append
+            add_missing = missing_player_ids.add
+            for tr, tour_matches in fetched:
+                for m in tour_matches:
+                    scheduled = m.get("ScheduledDate") or m.get("StartDate") or m.get("Date")
+                    if not scheduled:
                         continue
-                    if pid not in self.player_cache.players:
-                        missing_player_ids.add(pid)
+                    p1 = as_int(m.get("Player1ID") or m.get("P1") or m.get("Player1"))
+                    p2 = as_int(m.get("Player2ID") or m.get("P2") or m.get("Player2"))
+                    if p1 is not None and p1 not in players:
+                        add_missing(p1)
+                    if p2 is not None and p2 not in players:
+                        add_missing(p2)
+
+                    append_decorated(
+                        {
+                            "Tour": tr,
+                            "EventID": as_int(m.get("EventID") or m.get("Event") or m.get("EID")),
+                            "ScheduledDate": str(scheduled),
+                            "Player1ID": p1,
+                            "Player2ID": p2,
+                        }
+                    )
 
             if missing_player_ids:
                 _LOGGER.debug(
@@ -220,12 +332,12 @@ class UpcomingMatchesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     len(missing_player_ids),
                 )
                 try:
-                    players_payload = await self.api.paced_player_fetch(sorted(missing_player_ids), delay_s=1.0)
+                    players_payload = await self.api.paced_player_fetch(list(missing_player_ids), delay_s=ENRICH_PLAYER_DELAY_S)
                     added = 0
                     for pid, payload in players_payload.items():
-                        self.player_cache.players[pid] = _player_name_from_payload(payload)
+                        self.player_cache.set_player(pid, _player_name_from_payload(payload))
                         added += 1
-                    await save_player_cache(self.hass, self.player_cache)
+                    save_player_cache(self.hass, self.player_cache)
                     _LOGGER.debug(
                         "UpcomingMatchesCoordinator updated player cache from matches: added_or_updated=%s total_cached=%s",
                         added,
@@ -234,17 +346,19 @@ class UpcomingMatchesCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 except Exception:
                     _LOGGER.exception("UpcomingMatchesCoordinator failed to enrich missing players from API")
 
-            # Sort by scheduled date string
-            def sort_key(x: dict[str, Any]) -> str:
-                return str(x.get("ScheduledDate") or "")
-
-            decorated.sort(key=sort_key)
-            result = {"count": len(decorated), "matches": decorated}
-            _LOGGER.debug(
-                "UpcomingMatchesCoordinator merged result: total=%s first_match_keys=%s",
-                result["count"],
-                list((result["matches"][0] if result["matches"] else {}).keys()),
-            )
+            # Sort by scheduled date string (always a non-empty str, set during decoration)
+            decorated.sort(key=itemgetter("ScheduledDate"))
+            result = {
+                "count": len(decorated),
+                "matches": decorated,
+                "matches_by_tour": _index_matches_by_tour(decorated),
+            }
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "UpcomingMatchesCoordinator merged result: total=%s first_match_keys=%s",
+                    result["count"],
+                    list((result["matches"][0] if result["matches"] else {}).keys()),
+                )
             return result
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch upcoming matches: {err}") from err
@@ -265,20 +379,25 @@ class EventsInSeasonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         try:
             _LOGGER.debug("EventsInSeasonCoordinator refresh started: tours=%s", self.tours)
-            season_payload = self.season_coord.data or await self.api.get_current_season()
+            season_payload = self.season_coord.data or await self.api.get_current_season(use_cache=True)
             season = _extract_season(season_payload)
+            # Only the first refresh after setup may reuse persisted responses; later ones are explicit refreshes.
+            use_cache = self.data is None
 
             raw_events: list[dict[str, Any]] = []
             if self.tours:
-                for tr in self.tours:
-                    tour_events = await self.api.get_events_in_season(season, tr)
-                    _LOGGER.debug("EventsInSeasonCoordinator API response for tour=%s: count=%s", tr, len(tour_events))
+                for _tr, tour_events in await _async_fetch_per_tour(
+                    "EventsInSeasonCoordinator",
+                    self.tours,
+                    lambda tr: self.api.get_events_in_season(season, tr, use_cache=use_cache),
+                ):
                     raw_events.extend(tour_events)
             else:
-                raw_events = await self.api.get_events_in_season(season)
+                raw_events = await self.api.get_events_in_season(season, use_cache=use_cache)
                 _LOGGER.debug("EventsInSeasonCoordinator API response (no tour filter): count=%s", len(raw_events))
 
             events_by_id: dict[int, dict[str, Any]] = {}
+            event_details_by_id: dict[int, str] = {}
             for raw in raw_events:
                 event_id = raw.get("ID") or raw.get("EventID") or raw.get("EID")
                 if event_id is None:
@@ -298,6 +417,7 @@ class EventsInSeasonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "EndDate": str(raw.get("EndDate") or raw.get("End") or ""),
                 }
                 events_by_id[event_id_int] = event
+                event_details_by_id[event_id_int] = _format_event_details(event)
                 _LOGGER.debug(
                     "Event metadata: ID=%s Name=%s City=%s Venue=%s Type=%s",
                     event["ID"],
@@ -307,13 +427,14 @@ class EventsInSeasonCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     event["Type"],
                 )
 
-            events = sorted(events_by_id.values(), key=lambda x: x["ID"])
+            events = [events_by_id[event_id] for event_id in sorted(events_by_id)]
             _LOGGER.debug("EventsInSeasonCoordinator normalized events: season=%s count=%s", season, len(events))
             return {
                 "season": season,
                 "count": len(events),
                 "events": events,
                 "events_by_id": events_by_id,
+                "event_details_by_id": event_details_by_id,
             }
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch events in season: {err}") from err
@@ -343,12 +464,13 @@ class MatchScoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         try:
             _LOGGER.debug("MatchScoresCoordinator refresh started: tours=%s", self.tours)
             raw_matches: list[dict[str, Any]] = []
-            for tr in self.tours:
-                tour_matches = await self.api.get_current_matches(tr)
-                _LOGGER.debug("MatchScoresCoordinator API response for tour=%s: count=%s", tr, len(tour_matches))
+            for _tr, tour_matches in await _async_fetch_per_tour(
+                "MatchScoresCoordinator", self.tours, self.api.get_current_matches
+            ):
                 raw_matches.extend(tour_matches)
 
             events_map = (self.events_coord.data or {}).get("events_by_id", {})
+            players = self.player_cache.players
             matches: list[dict[str, Any]] = []
             missing_player_ids: set[int] = set()
 
@@ -365,12 +487,18 @@ class MatchScoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 p2_id = as_int(m.get("Player2ID"))
                 event_id = as_int(m.get("EventID"))
 
-                if p1_id and p1_id not in self.player_cache.players:
+                if p1_id and p1_id not in players:
                     missing_player_ids.add(p1_id)
-                if p2_id and p2_id not in self.player_cache.players:
+                if p2_id and p2_id not in players:
                     missing_player_ids.add(p2_id)
 
                 event = events_map.get(event_id or -1, {})
+                name1 = players.get(p1_id) if p1_id else None
+                if name1 is None:
+                    name1 = f"#{p1_id}" if p1_id else "TBD"
+                name2 = players.get(p2_id) if p2_id else None
+                if name2 is None:
+                    name2 = f"#{p2_id}" if p2_id else "TBD"
                 matches.append(
                     {
                         "MatchID": int(m.get("ID") or 0),
@@ -379,10 +507,10 @@ class MatchScoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         "EventType": event.get("Type") or "",
                         "EventCity": event.get("City") or "",
                         "Player1ID": p1_id,
-                        "Player1Name": self.player_cache.players.get(p1_id or -1, f"#{p1_id}" if p1_id else "TBD"),
+                        "Player1Name": name1,
                         "Score1": int(m.get("Score1") or 0),
                         "Player2ID": p2_id,
-                        "Player2Name": self.player_cache.players.get(p2_id or -1, f"#{p2_id}" if p2_id else "TBD"),
+                        "Player2Name": name2,
                         "Score2": int(m.get("Score2") or 0),
                         "Status": int(m.get("Status") or 0),
                         "Unfinished": bool(m.get("Unfinished")),
@@ -395,31 +523,33 @@ class MatchScoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if missing_player_ids:
                 _LOGGER.debug("MatchScoresCoordinator missing players to enrich: count=%s", len(missing_player_ids))
                 try:
-                    players_payload = await self.api.paced_player_fetch(sorted(missing_player_ids), delay_s=1.0)
+                    players_payload = await self.api.paced_player_fetch(list(missing_player_ids), delay_s=ENRICH_PLAYER_DELAY_S)
                     updated = 0
                     for pid, payload in players_payload.items():
-                        self.player_cache.players[pid] = _player_name_from_payload(payload)
+                        self.player_cache.set_player(pid, _player_name_from_payload(payload))
                         updated += 1
-                    await save_player_cache(self.hass, self.player_cache)
+                    save_player_cache(self.hass, self.player_cache)
                     _LOGGER.debug("MatchScoresCoordinator enriched players: updated=%s", updated)
 
                     for match in matches:
                         p1_id = match.get("Player1ID")
                         p2_id = match.get("Player2ID")
                         if p1_id:
-                            match["Player1Name"] = self.player_cache.players.get(p1_id, match["Player1Name"])
+                            match["Player1Name"] = players.get(p1_id, match["Player1Name"])
                         if p2_id:
-                            match["Player2Name"] = self.player_cache.players.get(p2_id, match["Player2Name"])
+                            match["Player2Name"] = players.get(p2_id, match["Player2Name"])
                 except Exception:
                     _LOGGER.exception("MatchScoresCoordinator failed to enrich missing players")
 
-            matches.sort(key=lambda x: (x.get("ScheduledDate") or "", x.get("MatchID") or 0))
+            # Both fields are always set above; a multi-key itemgetter builds the tuple in C
+            matches.sort(key=itemgetter("ScheduledDate", "MatchID"))
             result = {"count": len(matches), "matches": matches}
-            _LOGGER.debug(
-                "MatchScoresCoordinator normalized result: count=%s first_match_keys=%s",
-                result["count"],
-                list((result["matches"][0] if result["matches"] else {}).keys()),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "MatchScoresCoordinator normalized result: count=%s first_match_keys=%s",
+                    result["count"],
+                    list((result["matches"][0] if result["matches"] else {}).keys()),
+                )
             return result
         except Exception as err:
             raise UpdateFailed(f"Failed to fetch current match scores: {err}") from err
@@ -434,23 +564,20 @@ async def maybe_refresh_player_cache_monthly(hass: HomeAssistant, api, cache: Pl
         cache.last_refreshed,
         now.isoformat(),
     )
-    if cache.last_refreshed:
-        try:
-            last = dt_util.parse_datetime(cache.last_refreshed)
-        except Exception:
-            last = None
-        if last and (now - last) < timedelta(days=MONTHLY_REFRESH_DAYS):
-            _LOGGER.debug(
-                "Skipping monthly cache refresh: age_days=%.2f threshold_days=%s",
-                (now - last).total_seconds() / 86400,
-                MONTHLY_REFRESH_DAYS,
-            )
-            return
+    last = cache.last_refreshed_dt
+    if last and (now - last) < timedelta(days=MONTHLY_REFRESH_DAYS):
+        _LOGGER.debug(
+            "Skipping monthly cache refresh: age_days=%.2f threshold_days=%s",
+            (now - last).total_seconds() / 86400,
+            MONTHLY_REFRESH_DAYS,
+        )
+        return
 
     # Determine current season, then rankings -> top 100 IDs
-    season_payload = await api.get_current_season()
+    season_payload = await api.get_current_season(use_cache=True)
     season = _extract_season(season_payload)
-    _LOGGER.debug("Monthly cache refresh season payload keys=%s resolved_season=%s", list(season_payload.keys()), season)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Monthly cache refresh season payload keys=%s resolved_season=%s", list(season_payload.keys()), season)
 
     rankings = await api.get_rankings(season, RANKING_MONEY)
     _LOGGER.debug("Monthly cache refresh rankings fetched: count=%s", len(rankings))
@@ -462,19 +589,36 @@ async def maybe_refresh_player_cache_monthly(hass: HomeAssistant, api, cache: Pl
         top100_ids.append(int(pid))
     _LOGGER.debug("Monthly cache refresh top100 player ids prepared: count=%s", len(top100_ids))
 
-    # Paced fetch (5s delay per player as requested)
-    _LOGGER.debug("Monthly cache refresh paced player fetch started: ids=%s delay_s=5.0", len(top100_ids))
-    players_payload = await api.paced_player_fetch(top100_ids, delay_s=5.0)
+    # Concurrent fetch, still paced so the top-100 sweep stays gentle on the API
+    _LOGGER.debug(
+        "Monthly cache refresh paced player fetch started: ids=%s delay_s=%s",
+        len(top100_ids),
+        MONTHLY_PLAYER_DELAY_S,
+    )
+    players_payload = await api.paced_player_fetch(top100_ids, delay_s=MONTHLY_PLAYER_DELAY_S)
     _LOGGER.debug("Monthly cache refresh paced player fetch completed: payload_count=%s", len(players_payload))
 
     # Update cache
     updated = 0
     for pid, payload in players_payload.items():
-        cache.players[pid] = _player_name_from_payload(payload)
+        cache.set_player(pid, _player_name_from_payload(payload))
         updated += 1
 
+    missing = len(set(top100_ids) - players_payload.keys())
+    if missing:
+        # Keep what was fetched but leave last_refreshed alone so the next startup retries the sweep.
+        save_player_cache(hass, cache)
+        _LOGGER.warning(
+            "Monthly cache refresh incomplete: updated=%s missing=%s total_cached=%s; will retry on next check",
+            updated,
+            missing,
+            len(cache.players),
+        )
+        return
+
     cache.last_refreshed = now.isoformat()
-    await save_player_cache(hass, cache)
+    cache.last_refreshed_dt = now
+    save_player_cache(hass, cache)
     _LOGGER.debug(
         "Monthly cache refresh complete: updated=%s total_cached=%s last_refreshed=%s",
         updated,
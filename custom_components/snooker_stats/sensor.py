@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,6 +11,28 @@ from .const import DATA_COORD_EVENTS, DATA_COORD_RANKINGS, DATA_COORD_SCORES, DA
 UPCOMING_MATCH_ATTR_LIMIT = 25
 EVENT_ATTR_LIMIT = 50
 
+# Marks attribute caches that have not been built yet (coordinator data may legitimately be None)
+_UNSET = object()
+
+
+def _matches_attrs(d: dict) -> dict:
+    matches = d.get("matches", [])
+    return {
+        "matches": matches[:UPCOMING_MATCH_ATTR_LIMIT],
+        "matches_total": len(matches),
+        "matches_truncated": len(matches) > UPCOMING_MATCH_ATTR_LIMIT,
+    }
+
+
+def _events_attrs(d: dict) -> dict:
+    events = d.get("events", [])
+    return {
+        "season": d.get("season"),
+        "events": events[:EVENT_ATTR_LIMIT],
+        "events_total": len(events),
+        "events_truncated": len(events) > EVENT_ATTR_LIMIT,
+    }
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
@@ -87,12 +111,15 @@ class Top10OneYearMoneySensor(SensorEntity):
         return {"season": d.get("season"), "top10": d.get("top10_one_year_money", [])}
 
 
-class UpcomingMatchesSensor(SensorEntity):
-    _attr_name = "Snooker Upcoming Matches"
-    _attr_unique_id = "snooker_org_upcoming_matches"
+class _CountedListSensor(SensorEntity):
+    """Count of a coordinator list, with its (truncated) contents as attributes."""
+
+    _build_attrs: Callable[[dict], dict]
 
     def __init__(self, coord):
         self.coordinator = coord
+        self._attrs_for = _UNSET
+        self._attrs: dict = {}
 
     async def async_added_to_hass(self):
         self.coordinator.async_add_listener(self.async_write_ha_state)
@@ -104,66 +131,26 @@ class UpcomingMatchesSensor(SensorEntity):
 
     @property
     def extra_state_attributes(self):
-        d = self.coordinator.data or {}
-        matches = d.get("matches", [])
-        limited_matches = matches[:UPCOMING_MATCH_ATTR_LIMIT]
-        return {
-            "matches": limited_matches,
-            "matches_total": len(matches),
-            "matches_truncated": len(matches) > UPCOMING_MATCH_ATTR_LIMIT,
-        }
-
+        # Coordinators publish a new data dict per refresh, so rebuild only when it changes
+        if self.coordinator.data is not self._attrs_for:
+            self._attrs_for = self.coordinator.data
+            self._attrs = self._build_attrs(self.coordinator.data or {})
+        return self._attrs
 
-class EventsInSeasonSensor(SensorEntity):
-    _attr_name = "Snooker Events In Season"
-    _attr_unique_id = "snooker_org_events_in_season"
-
-    def __init__(self, coord):
-        self.coordinator = coord
 
-    async def async_added_to_hass(self):
-        self.coordinator.async_add_listener(self.async_write_ha_state)
+class UpcomingMatchesSensor(_CountedListSensor):
+    _attr_name = "Snooker Upcoming Matches"
+    _attr_unique_id = "snooker_org_upcoming_matches"
+    _build_attrs = staticmethod(_matches_attrs)
 
-    @property
-    def native_value(self):
-        d = self.coordinator.data or {}
-        return d.get("count", 0)
 
-    @property
-    def extra_state_attributes(self):
-        d = self.coordinator.data or {}
-        events = d.get("events", [])
-        limited_events = events[:EVENT_ATTR_LIMIT]
-        return {
-            "season": d.get("season"),
-            "events": limited_events,
-            "events_total": len(events),
-            "events_truncated": len(events) > EVENT_ATTR_LIMIT,
-        }
+class EventsInSeasonSensor(_CountedListSensor):
+    _attr_name = "Snooker Events In Season"
+    _attr_unique_id = "snooker_org_events_in_season"
+    _build_attrs = staticmethod(_events_attrs)
 
 
-class CurrentMatchScoresSensor(SensorEntity):
+class CurrentMatchScoresSensor(_CountedListSensor):
     _attr_name = "Snooker Current Match Scores"
     _attr_unique_id = "snooker_org_current_match_scores"
-
-    def __init__(self, coord):
-        self.coordinator = coord
-
-    async def async_added_to_hass(self):
-        self.coordinator.async_add_listener(self.async_write_ha_state)
-
-    @property
-    def native_value(self):
-        d = self.coordinator.data or {}
-        return d.get("count", 0)
-
-    @property
-    def extra_state_attributes(self):
-        d = self.coordinator.data or {}
-        matches = d.get("matches", [])
-        limited_matches = matches[:UPCOMING_MATCH_ATTR_LIMIT]
-        return {
-            "matches": limited_matches,
-            "matches_total": len(matches),
-            "matches_truncated": len(matches) > UPCOMING_MATCH_ATTR_LIMIT,
-        }
+    _build_attrs = staticmethod(_matches_attrs)